@@ -319,8 +319,7 @@ class MCPConfigurationManager:
         
         # Save to file
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, 'w') as f:
-            json.dump(updated_config, f, indent=2)
+        self.synchronizer.write_config(config_path, updated_config)
     
     def switch_application(self):
         """Switch to a different application using arrow navigation."""
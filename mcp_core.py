@@ -7,26 +7,31 @@ functionality for managing Model Context Protocol (MCP) server configurations
 across multiple applications.
 """
 
+import hashlib
+import io
 import json
 import os
 from pathlib import Path
 import logging
-from datetime import datetime
 import sys
+import shutil
+import tempfile
 import time
 import signal
 import threading
-from abc import ABC, abstractmethod
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Confirm
 from rich import box
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -34,32 +39,158 @@ logger = logging.getLogger(__name__)
 # Configure Rich console
 console = Console()
 
-class ConfigFormatHandler(ABC):
-    """Abstract base class for handling different MCP configuration formats."""
+# Report table cells that never change, pre-built as Text so rows skip markup parsing
+_ICON_OK = Text("✅", style="green")
+_ICON_FAIL = Text("❌", style="red")
+_TEXT_IN_SYNC = Text("✓ in sync", style="green")
+_TEXT_DASH = Text("—")
+
+# Process umask, applied to newly created config files (mkstemp creates them 0600)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# How many of its own recent write mtimes the synchronizer remembers per file
+_WRITTEN_MTIMES_KEPT = 4
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(config: dict, sort_keys: bool = False) -> bytes:
+    """Serialize a configuration to 2-space indented JSON bytes."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(config, option=option)
+    return json.dumps(config, indent=2, sort_keys=sort_keys).encode('utf-8')
+
+def _digest(data: bytes) -> bytes:
+    """Return a short content digest used to recognise unchanged config files."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+def _find_mismatched_keys(reference_config: dict, app_config: dict) -> list:
+    """List the reference keys that are missing or different in the app config."""
+    mismatched_keys = []
+    stack = [(reference_config, app_config, "")]
+    while stack:
+        ref_dict, app_dict, path = stack.pop()
+        for key, ref_value in ref_dict.items():
+            # Skip format field as it's metadata, not actual config data
+            if key == 'format':
+                continue
+                
+            if key not in app_dict:
+                mismatched_keys.append(f"{path}{key} (missing)")
+                continue
+                
+            app_value = app_dict[key]
+            # Equal subtrees (usually shared objects) need no walk
+            if app_value is ref_value or app_value == ref_value:
+                continue
+            if isinstance(ref_value, dict) and isinstance(app_value, dict):
+                stack.append((ref_value, app_value, f"{path}{key}."))
+            else:
+                mismatched_keys.append(f"{path}{key} (value mismatch)")
+    
+    return mismatched_keys
+
+def _make_report_table() -> Table:
+    """Create an empty sync report table with its columns set up."""
+    table = Table(
+        title="📋 Application Details",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold blue"
+    )
+    table.add_column("App", style="cyan", no_wrap=True, width=15)
+    table.add_column("Status", justify="center", width=8)
+    table.add_column("Action", style="white", width=10)
+    table.add_column("Size", justify="right", width=8)
+    table.add_column("Validation", justify="center", width=12)
+    table.add_column("Details", style="dim", width=30)
+    return table
+
+def _build_row(app_name: str, result: dict, validation: dict) -> tuple:
+    """Build the report table cells for one app's sync and validation results."""
+    success = result.get('success', False)
+    
+    # Status icon
+    status_cell = _ICON_OK if success else _ICON_FAIL
+    
+    # Action and size
+    action = result.get('action', 'failed')
+    size_str = f"{result.get('size', 0)} B" if success and 'size' in result else _TEXT_DASH
+    
+    # Details column (initialize first)
+    details = ""
+    if success and 'path' in result:
+        path = result['path']
+        path_parts = path.parts if isinstance(path, Path) else Path(path).parts
+        if len(path_parts) > 3:
+            details = f".../{path_parts[-2]}/{path_parts[-1]}"
+        else:
+            details = str(path)
+    elif not success:
+        if action == 'cancelled':
+            details = result.get('reason', 'user cancelled')
+        else:
+            error = result.get('error') or 'Unknown error'
+            details = error[:30] + "..." if len(error) > 30 else error
+    
+    # Validation status
+    if validation and success:
+        in_sync = validation.get('in_sync', False)
+        if in_sync:
+            validation_display = _TEXT_IN_SYNC
+        else:
+            reason = validation.get('reason', 'unknown')
+            validation_display = Text(f"✗ {reason}", style="red")
+            mismatched_keys = validation.get('mismatched_keys', [])
+            if mismatched_keys:
+                # Show first mismatched key in details if there are mismatches
+                details = f"Mismatch: {mismatched_keys[0]}"
+    else:
+        validation_display = _TEXT_DASH
+    
+    return (
+        f"📱 {app_name}",
+        status_cell,
+        action,
+        size_str,
+        validation_display,
+        details
+    )
+
+class ConfigFormatHandler:
+    """Base class for handling different MCP configuration formats."""
+    
+    __slots__ = ()
     
-    @abstractmethod
     def detect_format(self, config_data: dict) -> bool:
         """Detect if this handler can process the given configuration format."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def extract_mcp_config(self, config_data: dict) -> dict:
         """Extract MCP configuration from the app-specific format."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def merge_mcp_config(self, existing_config: dict, mcp_config: dict) -> dict:
-        """Merge MCP configuration back into the app-specific format."""
-        pass
+        """Merge MCP configuration back into the app-specific format.
+        
+        Returns existing_config itself (not a copy) when the merge would not change it.
+        """
+        raise NotImplementedError
     
-    @abstractmethod
     def get_format_name(self) -> str:
         """Get the name of this configuration format."""
-        pass
+        raise NotImplementedError
 
 class ClaudeDesktopHandler(ConfigFormatHandler):
     """Handler for Claude Desktop's mcpServers configuration format."""
     
+    __slots__ = ()
+    
     def detect_format(self, config_data: dict) -> bool:
         return 'mcpServers' in config_data
     
@@ -77,17 +208,20 @@ class ClaudeDesktopHandler(ConfigFormatHandler):
     
     def merge_mcp_config(self, existing_config: dict, mcp_config: dict) -> dict:
         """Merge MCP config back into Claude Desktop format."""
-        updated_config = existing_config.copy()
-        
         # If the MCP config is in normalized format, extract servers
         if isinstance(mcp_config, dict) and 'servers' in mcp_config:
-            updated_config['mcpServers'] = mcp_config['servers']
+            mcp_servers = mcp_config['servers']
         elif isinstance(mcp_config, dict) and 'mcpServers' in mcp_config:
-            updated_config['mcpServers'] = mcp_config['mcpServers']
+            mcp_servers = mcp_config['mcpServers']
         else:
             # Handle legacy format by wrapping in mcpServers
-            updated_config['mcpServers'] = mcp_config
+            mcp_servers = mcp_config
         
+        if 'mcpServers' in existing_config and existing_config['mcpServers'] == mcp_servers:
+            return existing_config
+        
+        updated_config = existing_config.copy()
+        updated_config['mcpServers'] = mcp_servers
         return updated_config
     
     def get_format_name(self) -> str:
@@ -96,6 +230,8 @@ class ClaudeDesktopHandler(ConfigFormatHandler):
 class StandardMCPHandler(ConfigFormatHandler):
     """Handler for the standard MCP configuration format used by other apps."""
     
+    __slots__ = ()
+    
     def detect_format(self, config_data: dict) -> bool:
         return 'mcp' in config_data
     
@@ -105,6 +241,9 @@ class StandardMCPHandler(ConfigFormatHandler):
     
     def merge_mcp_config(self, existing_config: dict, mcp_config: dict) -> dict:
         """Merge MCP configuration into standard format."""
+        if 'mcp' in existing_config and existing_config['mcp'] == mcp_config:
+            return existing_config
+        
         updated_config = existing_config.copy()
         updated_config['mcp'] = mcp_config
         return updated_config
@@ -115,6 +254,8 @@ class StandardMCPHandler(ConfigFormatHandler):
 class VSCodeHandler(ConfigFormatHandler):
     """Handler for VSCode's settings.json mcp.servers configuration format."""
     
+    __slots__ = ()
+    
     def detect_format(self, config_data: dict) -> bool:
         return 'mcp' in config_data and isinstance(config_data['mcp'], dict) and 'servers' in config_data['mcp']
     
@@ -134,29 +275,31 @@ class VSCodeHandler(ConfigFormatHandler):
     
     def merge_mcp_config(self, existing_config: dict, mcp_config: dict) -> dict:
         """Merge MCP config back into VSCode settings format."""
-        updated_config = existing_config.copy()
-        
-        # Initialize mcp section if it doesn't exist
-        if 'mcp' not in updated_config:
-            updated_config['mcp'] = {}
+        # Copy the mcp section (or initialize it) rather than mutating the caller's dict
+        mcp_section = dict(existing_config.get('mcp', {}))
         
         # Handle different input formats
         if isinstance(mcp_config, dict) and 'servers' in mcp_config:
             # Normalized format from VSCode or Claude Desktop
-            updated_config['mcp']['servers'] = mcp_config['servers']
+            mcp_section['servers'] = mcp_config['servers']
             if 'inputs' in mcp_config:
-                updated_config['mcp']['inputs'] = mcp_config['inputs']
+                mcp_section['inputs'] = mcp_config['inputs']
         elif isinstance(mcp_config, dict) and 'mcpServers' in mcp_config:
             # Claude Desktop format
-            updated_config['mcp']['servers'] = mcp_config['mcpServers']
+            mcp_section['servers'] = mcp_config['mcpServers']
         else:
             # Legacy format - wrap servers in VSCode structure
-            updated_config['mcp']['servers'] = mcp_config
+            mcp_section['servers'] = mcp_config
             
         # Ensure inputs exists
-        if 'inputs' not in updated_config['mcp']:
-            updated_config['mcp']['inputs'] = []
+        if 'inputs' not in mcp_section:
+            mcp_section['inputs'] = []
+        
+        if 'mcp' in existing_config and existing_config['mcp'] == mcp_section:
+            return existing_config
         
+        updated_config = existing_config.copy()
+        updated_config['mcp'] = mcp_section
         return updated_config
     
     def get_format_name(self) -> str:
@@ -165,6 +308,8 @@ class VSCodeHandler(ConfigFormatHandler):
 class CursorHandler(ConfigFormatHandler):
     """Handler for Cursor's mixed mcpServers + mcp.servers configuration format."""
     
+    __slots__ = ()
+    
     def detect_format(self, config_data: dict) -> bool:
         """Detect Cursor's specific mixed format with both mcpServers and mcp sections."""
         return ('mcpServers' in config_data and 
@@ -186,6 +331,10 @@ class CursorHandler(ConfigFormatHandler):
     
     def merge_mcp_config(self, existing_config: dict, mcp_config: dict) -> dict:
         """Merge MCP config into Cursor format, cleaning up legacy mcpServers."""
+        if ('mcpServers' not in existing_config and 'mcp' in existing_config
+                and existing_config['mcp'] == mcp_config):
+            return existing_config
+        
         updated_config = existing_config.copy()
         
         # Use standard MCP format for the new section
@@ -204,6 +353,8 @@ class CursorHandler(ConfigFormatHandler):
 class LegacyMCPHandler(ConfigFormatHandler):
     """Handler for legacy/empty configurations that need to be initialized."""
     
+    __slots__ = ()
+    
     def detect_format(self, config_data: dict) -> bool:
         # This handler accepts any config that doesn't match other formats
         return True
@@ -214,6 +365,9 @@ class LegacyMCPHandler(ConfigFormatHandler):
     
     def merge_mcp_config(self, existing_config: dict, mcp_config: dict) -> dict:
         """Merge MCP configuration using standard format."""
+        if 'mcp' in existing_config and existing_config['mcp'] == mcp_config:
+            return existing_config
+        
         updated_config = existing_config.copy()
         updated_config['mcp'] = mcp_config
         return updated_config
@@ -221,6 +375,21 @@ class LegacyMCPHandler(ConfigFormatHandler):
     def get_format_name(self) -> str:
         return "Legacy/Empty"
 
+# Handlers are stateless, so a single shared instance of each is used everywhere
+_CLAUDE = ClaudeDesktopHandler()
+_STANDARD = StandardMCPHandler()
+_VSCODE = VSCodeHandler()
+_CURSOR = CursorHandler()
+_LEGACY = LegacyMCPHandler()
+
+# Format handlers keyed by top-level key signature: bit 1 = 'mcpServers', bit 0 = 'mcp'
+_SIG_TO_HANDLER = {
+    0b11: _CURSOR,
+    0b10: _CLAUDE,
+    0b01: _STANDARD,
+    0b00: _LEGACY
+}
+
 class MCPConfigWatcher(FileSystemEventHandler):
     """File system event handler for watching MCP configuration changes."""
     
@@ -228,8 +397,23 @@ class MCPConfigWatcher(FileSystemEventHandler):
         super().__init__()
         self.synchronizer = synchronizer
         self.debounce_delay = debounce_delay
+        # Debounced syncs waiting to run, keyed by app -> (monotonic deadline, file path)
         self.pending_syncs = {}
+        self.running_syncs = set()
         self.lock = threading.Lock()
+        self.condition = threading.Condition(self.lock)
+        self.stopped = False
+        # Hash of the MCP configuration each app was last synced to (worker thread only)
+        self._last_hash = {}
+        # Map each monitored config's resolved path to its app so events need a single lookup
+        self._path_to_app = {
+            str(config_path.resolve()): app_name
+            for app_name, config_path in synchronizer.CONFIG_FILES.items()
+            if config_path.parent.exists()
+        }
+        # A single long-lived worker fires due syncs instead of a Timer thread per event
+        self.worker = threading.Thread(target=self._run_pending_syncs, daemon=True)
+        self.worker.start()
         
     def on_modified(self, event):
         if event.is_directory:
@@ -238,74 +422,113 @@ class MCPConfigWatcher(FileSystemEventHandler):
         file_path = Path(event.src_path)
         
         # Check if this is one of our monitored config files
-        source_app = None
-        for app_name, config_path in self.synchronizer.CONFIG_FILES.items():
-            try:
-                if file_path.exists() and config_path.exists() and file_path.samefile(config_path):
-                    source_app = app_name
-                    break
-            except (OSError, FileNotFoundError):
-                # File might have been deleted or moved, skip
-                continue
+        source_app = self._path_to_app.get(str(file_path.resolve()))
         
         if source_app:
-            # Check if this change was caused by our own sync operation
-            if self._is_sync_in_progress(source_app):
-                logger.debug(f"Ignoring self-triggered change in {source_app} config")
-                return
-                
-            logger.info(f"Detected external change in {source_app} config: {file_path}")
-            self._schedule_sync(source_app, file_path)
+            self.handle_change(source_app, file_path)
+    
+    def handle_change(self, source_app, file_path):
+        """Schedule a debounced sync for a changed config file."""
+        # Check if this change was caused by our own sync operation
+        if self._is_sync_in_progress(source_app):
+            logger.debug(f"Ignoring self-triggered change in {source_app} config")
+            return
+            
+        logger.info(f"Detected external change in {source_app} config: {file_path}")
+        self._schedule_sync(source_app, file_path)
+    
+    def stop(self):
+        """Stop the sync worker; syncs still pending are dropped."""
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
     
     def _is_sync_in_progress(self, app_name):
         """Check if a sync operation is currently in progress for this app."""
         # Simple check - if there's a pending sync, assume we might be in the middle of it
         with self.lock:
-            return app_name in self.pending_syncs
+            return app_name in self.pending_syncs or app_name in self.running_syncs
     
     def _schedule_sync(self, source_app, file_path):
         """Schedule a sync with debouncing to avoid rapid successive syncs."""
-        with self.lock:
-            # Cancel any existing timer for this app
-            if source_app in self.pending_syncs:
-                self.pending_syncs[source_app].cancel()
+        with self.condition:
+            # Replacing an existing entry restarts the debounce window for this app
+            self.pending_syncs[source_app] = (time.monotonic() + self.debounce_delay, file_path)
+            self.condition.notify()
+    
+    def _run_pending_syncs(self):
+        """Worker loop that runs each pending sync once its debounce deadline has passed."""
+        while True:
+            with self.condition:
+                while True:
+                    if self.stopped:
+                        return
+                    
+                    now = time.monotonic()
+                    due = [app for app, (deadline, _) in self.pending_syncs.items() if deadline <= now]
+                    if due:
+                        break
+                    
+                    # Sleep until the next deadline, or until a new sync is scheduled
+                    next_deadline = min((deadline for deadline, _ in self.pending_syncs.values()), default=None)
+                    self.condition.wait(None if next_deadline is None else next_deadline - now)
+                
+                ready = []
+                for source_app in due:
+                    _, file_path = self.pending_syncs.pop(source_app)
+                    self.running_syncs.add(source_app)
+                    ready.append((source_app, file_path))
             
-            # Schedule new sync
-            timer = threading.Timer(
-                self.debounce_delay, 
-                self._execute_sync, 
-                args=(source_app, file_path)
-            )
-            timer.start()
-            self.pending_syncs[source_app] = timer
+            for source_app, file_path in ready:
+                self._execute_sync(source_app, file_path)
+    
+    def _get_config_hash(self, file_path):
+        """Hash a config file's MCP section, ignoring formatting and key order."""
+        config, _, mcp_config = self.synchronizer.load_mcp_config(file_path)
+        if not config:
+            return None
+        
+        mcp_config = {k: v for k, v in mcp_config.items() if k != 'format'}
+        return hashlib.sha1(_dumps(mcp_config, sort_keys=True)).digest()
     
     def _execute_sync(self, source_app, file_path):
         """Execute the actual sync operation."""
         try:
+            # Skip saves that did not change the MCP configuration (whitespace, touch, other settings)
+            config_hash = self._get_config_hash(file_path)
+            if config_hash is not None and self._last_hash.get(source_app) == config_hash:
+                logger.info(f"Skipping sync from {source_app}: MCP configuration unchanged")
+                return
+            
             logger.info(f"Starting automatic sync from {source_app}")
             success = self.synchronizer.sync_from_file(source_app)
             
             if success:
                 logger.info(f"Automatic sync from {source_app} completed successfully")
+                # Each app's extracted MCP section differs (VSCode keeps inputs, Claude only
+                # servers), so hash every app's own file; these are cache hits after the write
+                for app_name, config_path in self.synchronizer.CONFIG_FILES.items():
+                    self._last_hash[app_name] = self._get_config_hash(config_path)
             else:
                 logger.error(f"Automatic sync from {source_app} failed")
                 
         except Exception as e:
             logger.error(f"Error during automatic sync from {source_app}: {e}")
         finally:
-            # Clean up the timer reference
             with self.lock:
-                self.pending_syncs.pop(source_app, None)
+                self.running_syncs.discard(source_app)
 
 class MCPSyncDaemon:
     """Daemon for running continuous MCP configuration synchronization."""
     
-    def __init__(self, synchronizer, watch_apps=None, debounce_delay=2.0):
+    def __init__(self, synchronizer, watch_apps=None, debounce_delay=2.0, poll_interval=1.0):
         self.synchronizer = synchronizer
         self.watch_apps = watch_apps or list(synchronizer.CONFIG_FILES.keys())
         self.debounce_delay = debounce_delay
-        self.observer = Observer()
+        self.poll_interval = poll_interval
         self.event_handler = MCPConfigWatcher(synchronizer, debounce_delay)
+        self.poll_thread = None
+        self.stop_event = threading.Event()
         self.running = False
         
     def start(self):
@@ -314,25 +537,19 @@ class MCPSyncDaemon:
         logger.info(f"Watching apps: {', '.join(self.watch_apps)}")
         logger.info(f"Debounce delay: {self.debounce_delay}s")
         
-        # Setup file watchers for each monitored app
-        watched_paths = set()
+        # Poll the config files themselves rather than watching their (busy) parent directories,
+        # building the unique file set up front so each file is stat'ed once per poll
+        watched_files = {}
         for app_name in self.watch_apps:
             if app_name in self.synchronizer.CONFIG_FILES:
-                config_path = self.synchronizer.CONFIG_FILES[app_name]
-                
-                # Watch the parent directory since the file might not exist yet
-                watch_dir = config_path.parent
-                if watch_dir not in watched_paths:
-                    self.observer.schedule(
-                        self.event_handler, 
-                        str(watch_dir), 
-                        recursive=False
-                    )
-                    watched_paths.add(watch_dir)
-                    logger.info(f"Watching directory: {watch_dir}")
-        
-        # Start the observer
-        self.observer.start()
+                watched_files.setdefault(self.synchronizer.CONFIG_FILES[app_name], app_name)
+        for config_path in watched_files:
+            logger.info(f"Watching file: {config_path}")
+        
+        # Start the poller
+        self.stop_event.clear()
+        self.poll_thread = threading.Thread(target=self._poll_files, args=(watched_files,), daemon=True)
+        self.poll_thread.start()
         self.running = True
         
         # Setup signal handlers for graceful shutdown
@@ -351,13 +568,39 @@ class MCPSyncDaemon:
     
     def stop(self):
         """Stop the file watching daemon."""
-        if self.running:
+        if self.poll_thread is not None:
             logger.info("Stopping MCP Config Sync Daemon")
             self.running = False
-            self.observer.stop()
-            self.observer.join()
+            self.stop_event.set()
+            self.poll_thread.join()
+            self.poll_thread = None
+            self.event_handler.stop()
             logger.info("Daemon stopped")
     
+    def _poll_files(self, watched_files):
+        """Poll watched config files (path -> app name) and hand modified ones to the event handler."""
+        last_seen = {config_path: self._get_mtime_ns(config_path) for config_path in watched_files}
+        
+        while not self.stop_event.wait(self.poll_interval):
+            for config_path, app_name in watched_files.items():
+                mtime_ns = self._get_mtime_ns(config_path)
+                if mtime_ns == last_seen[config_path]:
+                    continue
+                
+                last_seen[config_path] = mtime_ns
+                # A deleted file has nothing to sync from, and our own writes need no sync
+                if mtime_ns is None or mtime_ns in self.synchronizer.written_mtimes.get(config_path, ()):
+                    continue
+                self.event_handler.handle_change(app_name, config_path)
+    
+    @staticmethod
+    def _get_mtime_ns(path):
+        """Return the file's modification time in nanoseconds, or None if it is missing."""
+        try:
+            return path.stat().st_mtime_ns
+        except (OSError, FileNotFoundError):
+            return None
+    
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
         logger.info(f"Received signal {signum}, shutting down...")
@@ -377,23 +620,14 @@ class MCPConfigSynchronizer:
         'VSCode': Path.home() / 'Library' / 'Application Support' / 'Code' / 'User' / 'settings.json'
     }
     
-    # Configuration format handlers (order matters - most specific first)
-    FORMAT_HANDLERS = [
-        ClaudeDesktopHandler(),
-        VSCodeHandler(),
-        CursorHandler(),
-        StandardMCPHandler(),
-        LegacyMCPHandler()  # Fallback handler
-    ]
-    
     # Map applications to their preferred handlers
     APP_HANDLERS = {
-        'Claude': ClaudeDesktopHandler(),
-        'VSCode': VSCodeHandler(),
-        'Cursor': CursorHandler(),
-        'Windsurf': StandardMCPHandler(),
-        'Roocode-VSCode': StandardMCPHandler(),
-        'Roocode-Windsurf': StandardMCPHandler()
+        'Claude': _CLAUDE,
+        'VSCode': _VSCODE,
+        'Cursor': _CURSOR,
+        'Windsurf': _STANDARD,
+        'Roocode-VSCode': _STANDARD,
+        'Roocode-Windsurf': _STANDARD
     }
     
     DEFAULT_MCP_CONFIG = {
@@ -403,12 +637,32 @@ class MCPConfigSynchronizer:
     def __init__(self):
         self.config = self.DEFAULT_MCP_CONFIG.copy()
         self.sync_results = {}
+        # Parsed configs keyed by path -> ((st_mtime_ns, st_size), config, handler, mcp_config, digest)
+        self._config_cache = {}
+        # Tuples of the st_mtime_ns of this synchronizer's recent writes, keyed by path, so a
+        # poller lagging behind back-to-back writes still recognizes the earlier ones
+        self.written_mtimes = {}
         # Filter CONFIG_FILES to only include apps that are actually installed
         self._filter_installed_apps()
     
     def _filter_installed_apps(self):
         """Filter CONFIG_FILES to only include applications that are actually installed."""
         installed_apps = {}
+        application_support = Path.home() / 'Library' / 'Application Support'
+        
+        # All app directories live under a couple of parents (~/ and Application Support),
+        # so list each parent once with os.scandir instead of stat'ing every app directory
+        dir_entries = {}
+        
+        def dir_exists(app_dir):
+            parent = app_dir.parent
+            if parent not in dir_entries:
+                try:
+                    with os.scandir(parent) as entries:
+                        dir_entries[parent] = {entry.name for entry in entries}
+                except OSError:
+                    dir_entries[parent] = set()
+            return app_dir.name in dir_entries[parent]
         
         for app_name, config_path in self.CONFIG_FILES.items():
             # Check if the application directory exists
@@ -426,12 +680,12 @@ class MCPConfigSynchronizer:
             elif app_name.startswith('Roocode'):
                 # For Roocode variants, check if the base application directory exists
                 if 'VSCode' in app_name:
-                    app_dir = Path.home() / 'Library' / 'Application Support' / 'Code'
+                    app_dir = application_support / 'Code'
                 elif 'Windsurf' in app_name:
-                    app_dir = Path.home() / 'Library' / 'Application Support' / 'Windsurf - Next'
+                    app_dir = application_support / 'Windsurf - Next'
             
             # Include the app if its directory exists (indicating it's installed)
-            if app_dir and app_dir.exists():
+            if app_dir and dir_exists(app_dir):
                 installed_apps[app_name] = config_path
                 logger.debug(f"Application {app_name} detected at {app_dir}")
             else:
@@ -443,30 +697,68 @@ class MCPConfigSynchronizer:
     
     def detect_config_format(self, config_data: dict) -> ConfigFormatHandler:
         """Detect the appropriate format handler for the given configuration."""
-        for handler in self.FORMAT_HANDLERS:
-            if handler.detect_format(config_data):
-                return handler
-        # Should never reach here due to LegacyMCPHandler fallback
-        return LegacyMCPHandler()
+        sig = (('mcpServers' in config_data) << 1) | ('mcp' in config_data)
+        if sig == 0b01:
+            mcp_section = config_data['mcp']
+            if isinstance(mcp_section, dict) and 'servers' in mcp_section:
+                return _VSCODE
+        elif sig == 0b11 and not isinstance(config_data['mcp'], dict):
+            # Cursor's mixed format needs an mcp object; fall back to mcpServers
+            sig = 0b10
+        return _SIG_TO_HANDLER[sig]
     
     def get_app_handler(self, app_name: str) -> ConfigFormatHandler:
         """Get the appropriate format handler for a specific application."""
-        return self.APP_HANDLERS.get(app_name, StandardMCPHandler())
+        return self.APP_HANDLERS.get(app_name, _STANDARD)
     
     def ensure_directories(self):
         """Ensure all parent directories for config files exist."""
-        for config_path in self.CONFIG_FILES.values():
-            config_path.parent.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Ensured directory exists: {config_path.parent}")
+        # Several apps can share a parent directory, so create each one only once
+        for config_dir in {config_path.parent for config_path in self.CONFIG_FILES.values()}:
+            config_dir.mkdir(parents=True, exist_ok=True)
+            logger.info(f"Ensured directory exists: {config_dir}")
     
     def load_existing_config(self, config_path):
-        """Load existing configuration from a file if it exists."""
+        """Load existing configuration from a file if it exists.
+        
+        Parsed configs are cached until the file's mtime or size changes, so the
+        returned dict is shared and must not be mutated by callers.
+        """
         try:
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    return json.load(f)
+            return self._read_config(config_path)
+        except FileNotFoundError:
             return {}
+    
+    def _read_config(self, config_path):
+        """Load a configuration file, raising FileNotFoundError if it does not exist.
+        
+        Returns None if the file exists but could not be read or parsed.
+        """
+        try:
+            stat = config_path.stat()
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._config_cache.get(config_path)
+            if cached is not None and cached[0] == cache_key:
+                return cached[1]
+            
+            # Unchanged files never get here, so a plain read is all a miss needs; parsing
+            # from an mmap was measured no faster for large files and slower for small ones
+            data = config_path.read_bytes()
+            digest = _digest(data)
+            if cached is not None and cached[4] == digest:
+                # Touched or rewritten with identical content: keep the parsed config
+                self._config_cache[config_path] = (cache_key,) + cached[1:]
+                return cached[1]
+            
+            config = _loads(data)
+            self._cache_config(config_path, cache_key, config, digest)
+            return config
+        except FileNotFoundError:
+            # Also covers a file deleted between the stat and the read
+            self._config_cache.pop(config_path, None)
+            raise
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             logger.error(f"Failed to parse config at {config_path}: {e}")
             # Return None to indicate a parsing error, not just an empty config
             return None
@@ -474,17 +766,102 @@ class MCPConfigSynchronizer:
             logger.error(f"Error loading config at {config_path}: {e}")
             return None
     
+    def load_mcp_config(self, config_path):
+        """Load a config file and return (config, handler, mcp_config).
+        
+        The detected format handler and extracted MCP config are cached with the
+        parsed file, so unchanged files skip format detection as well as parsing.
+        Returns ({}, None, {}) if the file does not exist and (None, None, None)
+        if it could not be parsed.
+        """
+        try:
+            config = self._read_config(config_path)
+        except FileNotFoundError:
+            return {}, None, {}
+        if config is None:
+            return None, None, None
+        
+        cached = self._config_cache.get(config_path)
+        if cached is not None and cached[1] is config:
+            return cached[1:4]
+        
+        # The cache entry was replaced after the read; detect the format directly
+        handler = self.detect_config_format(config)
+        return config, handler, handler.extract_mcp_config(config)
+    
+    def _cache_config(self, config_path, cache_key, config, digest):
+        """Cache a parsed config along with its detected handler, MCP config and content digest."""
+        handler = self.detect_config_format(config)
+        self._config_cache[config_path] = (cache_key, config, handler, handler.extract_mcp_config(config), digest)
+    
+    def write_config(self, config_path, config):
+        """Atomically write a configuration file and return its new stat result.
+        
+        The JSON is written to a uniquely named sibling temp file, fsynced and
+        moved over the target with os.replace, so readers (including the file
+        watcher and other processes writing the same config) never observe a
+        truncated or partially written config. Returns None without writing if
+        the file already holds exactly these bytes.
+        """
+        # Write next to the real file so symlinked configs stay symlinks
+        target_path = config_path.resolve()
+        data = _dumps(config)
+        if self._file_has_content(target_path, data):
+            return None
+        
+        fd, tmp_name = tempfile.mkstemp(dir=target_path.parent, prefix=target_path.name + '.', suffix='.tmp')
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                tmp_file.write(data)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            if target_path.exists():
+                shutil.copymode(target_path, tmp_path)
+            else:
+                os.chmod(tmp_path, 0o666 & ~_UMASK)
+            # The rename keeps the temp file's mtime, so record it before the new
+            # file becomes visible; otherwise the daemon's poller can see our own
+            # write first and report it as an external change
+            stat = os.stat(tmp_path)
+            recent = self.written_mtimes.get(config_path, ())
+            self.written_mtimes[config_path] = recent[-(_WRITTEN_MTIMES_KEPT - 1):] + (stat.st_mtime_ns,)
+            os.replace(tmp_path, target_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        # Prime the cache with what we just wrote so validation skips the re-parse
+        self._cache_config(config_path, (stat.st_mtime_ns, stat.st_size), config, _digest(data))
+        return stat
+    
+    @staticmethod
+    def _file_has_content(file_path, data):
+        """Check whether a file already contains exactly the given bytes."""
+        try:
+            # Only read the file back when the size already matches
+            if file_path.stat().st_size != len(data):
+                return False
+            return file_path.read_bytes() == data
+        except OSError:
+            return False
+    
     def merge_configs(self, existing_config, new_config):
         """Merge existing config with new config, preserving existing values where applicable."""
-        def deep_merge(d1, d2):
-            for key, value in d2.items():
-                if isinstance(value, dict) and key in d1:
-                    d1[key] = deep_merge(d1.get(key, {}), value)
+        merged = existing_config.copy()
+        stack = [(merged, new_config)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                existing_value = target.get(key)
+                if isinstance(value, dict) and isinstance(existing_value, dict):
+                    # Copy before merging so cached configs are never mutated
+                    target[key] = existing_value = existing_value.copy()
+                    stack.append((existing_value, value))
                 else:
-                    d1[key] = value
-            return d1
+                    target[key] = value
         
-        return deep_merge(existing_config.copy(), new_config)
+        return merged
     
     def check_destructive_operations(self):
         """Check if the sync operation would remove existing MCP servers."""
@@ -495,25 +872,22 @@ class MCPConfigSynchronizer:
             if not config_path.exists():
                 continue
                 
-            existing_config = self.load_existing_config(config_path)
+            existing_config, handler, existing_mcp_config = self.load_mcp_config(config_path)
             if existing_config is None:
                 continue
                 
             # Extract existing MCP servers
-            handler = self.detect_config_format(existing_config)
-            existing_mcp_config = handler.extract_mcp_config(existing_config)
             existing_servers = existing_mcp_config.get('servers', {})
             
-            # Check if we're removing servers
-            if existing_servers and len(existing_servers) > len(source_servers):
-                lost_servers = set(existing_servers.keys()) - set(source_servers.keys())
-                if lost_servers:
-                    destructive_apps.append({
-                        'app_name': app_name,
-                        'existing_servers': list(existing_servers.keys()),
-                        'lost_servers': list(lost_servers),
-                        'remaining_servers': list(source_servers.keys())
-                    })
+            # Check if we're removing servers (a size comparison misses renamed servers)
+            lost_servers = set(existing_servers) - set(source_servers)
+            if lost_servers:
+                destructive_apps.append({
+                    'app_name': app_name,
+                    'existing_servers': list(existing_servers.keys()),
+                    'lost_servers': list(lost_servers),
+                    'remaining_servers': list(source_servers.keys())
+                })
         
         return destructive_apps
     
@@ -575,163 +949,170 @@ class MCPConfigSynchronizer:
                 return {app_name: {'success': False, 'action': 'cancelled', 'reason': 'user_cancelled'} 
                        for app_name in self.CONFIG_FILES.keys()}
         
-        results = {}
-        for app_name, config_path in self.CONFIG_FILES.items():
-            try:
-                # Load existing config to preserve any app-specific settings
-                existing_config = self.load_existing_config(config_path)
-                
-                # If parsing failed, skip this config
-                if existing_config is None:
-                    logger.error(f"Skipping update for {app_name} due to parsing error")
-                    results[app_name] = {
-                        'success': False, 
-                        'path': config_path,
-                        'error': 'Failed to parse existing config',
-                        'action': 'skipped'
-                    }
-                    continue
-                
-                # Get file status before update
-                file_existed = config_path.exists()
-                
-                # Get the appropriate handler for this app
-                handler = self.get_app_handler(app_name)
-                
-                # Merge with new MCP config using format-specific handler
-                updated_config = handler.merge_mcp_config(existing_config, self.config)
-                
-                # Write updated config
-                with open(config_path, 'w') as f:
-                    json.dump(updated_config, f, indent=2)
-                
-                # Record result
-                action = 'updated' if file_existed else 'created'
-                logger.info(f"Successfully {action} config for {app_name} at {config_path} using {handler.get_format_name()} format")
-                results[app_name] = {
-                    'success': True, 
+        # Load each file again after the (possibly long) confirmation prompt so edits made
+        # in the meantime are merged rather than overwritten; unchanged files hit the cache
+        return {
+            app_name: self._update_app_config(app_name, config_path)
+            for app_name, config_path in self.CONFIG_FILES.items()
+        }
+    
+    def _update_app_config(self, app_name, config_path):
+        """Merge the current MCP configuration into one app's config file and return the result."""
+        try:
+            # Load existing config to preserve any app-specific settings
+            existing_config = self.load_existing_config(config_path)
+            
+            # If parsing failed, skip this config
+            if existing_config is None:
+                logger.error(f"Skipping update for {app_name} due to parsing error")
+                return {
+                    'success': False, 
                     'path': config_path,
-                    'action': action,
-                    'size': config_path.stat().st_size,
-                    'format': handler.get_format_name()
+                    'error': 'Failed to parse existing config',
+                    'action': 'skipped'
                 }
-                
-            except Exception as e:
-                logger.error(f"Failed to update config for {app_name} at {config_path}: {e}")
-                results[app_name] = {
-                    'success': False, 
+            
+            # Get file status before update
+            file_existed = config_path.exists()
+            
+            # Get the appropriate handler for this app
+            handler = self.get_app_handler(app_name)
+            format_name = handler.get_format_name()
+            
+            # Merge with new MCP config using format-specific handler
+            updated_config = handler.merge_mcp_config(existing_config, self.config)
+            
+            # The handler hands back the existing config when it is already up to date,
+            # and write_config returns None when the file already has the same bytes
+            stat = None
+            if not (file_existed and updated_config is existing_config):
+                stat = self.write_config(config_path, updated_config)
+            
+            if stat is None:
+                logger.info(f"Config for {app_name} at {config_path} is already up to date")
+                return {
+                    'success': True,
                     'path': config_path,
-                    'error': str(e),
-                    'action': 'failed'
+                    'action': 'unchanged',
+                    'size': config_path.stat().st_size,
+                    'format': format_name
                 }
-        
-        return results
+            
+            # Record result
+            action = 'updated' if file_existed else 'created'
+            logger.info(f"Successfully {action} config for {app_name} at {config_path} using {format_name} format")
+            return {
+                'success': True, 
+                'path': config_path,
+                'action': action,
+                'size': stat.st_size,
+                'format': format_name
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to update config for {app_name} at {config_path}: {e}")
+            return {
+                'success': False, 
+                'path': config_path,
+                'error': str(e),
+                'action': 'failed'
+            }
     
     def validate_configs(self, reference_config=None):
         """Validate that all configuration files are in sync and properly formatted."""
         if reference_config is None:
             reference_config = self.config
         
-        all_in_sync = True
-        validation_results = {}
+        validation_results = {
+            app_name: self._validate_app_config(app_name, config_path, reference_config)
+            for app_name, config_path in self.CONFIG_FILES.items()
+        }
+        
+        all_in_sync = all(result['in_sync'] for result in validation_results.values())
+        if all_in_sync:
+            logger.info("All configuration files are in sync with the reference configuration")
         
-        for app_name, config_path in self.CONFIG_FILES.items():
-            if not config_path.exists():
-                logger.warning(f"Config file missing for {app_name} at {config_path}")
-                validation_results[app_name] = {'in_sync': False, 'reason': 'missing'}
-                all_in_sync = False
-                continue
-                
-            config = self.load_existing_config(config_path)
-            if config is None:
-                logger.warning(f"Config file for {app_name} at {config_path} could not be parsed")
-                validation_results[app_name] = {'in_sync': False, 'reason': 'parse_error'}
-                all_in_sync = False
-                continue
+        return all_in_sync, validation_results
+    
+    def _validate_app_config(self, app_name, config_path, reference_config):
+        """Validate one app's config file against the reference config and return the result."""
+        config, handler, mcp_config = self.load_mcp_config(config_path)
+        if config is None:
+            logger.warning(f"Config file for {app_name} at {config_path} could not be parsed")
+            return {'in_sync': False, 'reason': 'parse_error'}
+        
+        if handler is None:
+            logger.warning(f"Config file missing for {app_name} at {config_path}")
+            return {'in_sync': False, 'reason': 'missing'}
+        
+        # For Claude Desktop format, we need to compare the servers structure
+        if type(handler) is ClaudeDesktopHandler:
+            # Extract servers from both configurations for comparison
+            ref_servers = reference_config.get('servers', {}) if isinstance(reference_config, dict) and 'servers' in reference_config else {}
+            app_servers = mcp_config.get('servers', {}) if isinstance(mcp_config, dict) and 'servers' in mcp_config else {}
             
-            # Use format-specific handler to extract MCP config for comparison
-            handler = self.detect_config_format(config)
-            mcp_config = handler.extract_mcp_config(config)
+            # If reference config is in legacy format, we can't do meaningful comparison
+            if not ref_servers and reference_config:
+                logger.info(f"Skipping validation for {app_name} - reference config is in legacy format, app uses Claude Desktop format")
+                return {'in_sync': True, 'reason': 'format_mismatch_skip'}
             
-            # For Claude Desktop format, we need to compare the servers structure
-            if isinstance(handler, ClaudeDesktopHandler):
-                # Extract servers from both configurations for comparison
-                ref_servers = reference_config.get('servers', {}) if isinstance(reference_config, dict) and 'servers' in reference_config else {}
-                app_servers = mcp_config.get('servers', {}) if isinstance(mcp_config, dict) and 'servers' in mcp_config else {}
-                
-                # If reference config is in legacy format, we can't do meaningful comparison
-                if not ref_servers and reference_config:
-                    logger.info(f"Skipping validation for {app_name} - reference config is in legacy format, app uses Claude Desktop format")
-                    validation_results[app_name] = {'in_sync': True, 'reason': 'format_mismatch_skip'}
-                    continue
-                
-                # Compare server configurations
-                is_in_sync = app_servers == ref_servers
-                if not is_in_sync:
-                    mismatched_keys = ['servers (content mismatch)']
-                else:
-                    mismatched_keys = []
+            # Compare server configurations
+            is_in_sync = app_servers == ref_servers
+            if not is_in_sync:
+                mismatched_keys = ['servers (content mismatch)']
             else:
-                # Standard validation for other formats
-                is_in_sync = True
                 mismatched_keys = []
-                
-                def check_nested_dict(ref_dict, app_dict, path=""):
-                    nonlocal is_in_sync, mismatched_keys
-                    for key, ref_value in ref_dict.items():
-                        # Skip format field as it's metadata, not actual config data
-                        if key == 'format':
-                            continue
-                            
-                        if key not in app_dict:
-                            is_in_sync = False
-                            mismatched_keys.append(f"{path}{key} (missing)")
-                            continue
-                            
-                        app_value = app_dict[key]
-                        if isinstance(ref_value, dict) and isinstance(app_value, dict):
-                            check_nested_dict(ref_value, app_value, f"{path}{key}.")
-                        elif ref_value != app_value:
-                            is_in_sync = False
-                            mismatched_keys.append(f"{path}{key} (value mismatch)")
-                
-                check_nested_dict(reference_config, mcp_config)
-            
-            if not is_in_sync:
-                logger.warning(f"Config mismatch detected for {app_name} at {config_path}")
-                logger.warning(f"Mismatched keys: {', '.join(mismatched_keys)}")
-                logger.debug(f"Reference config for {app_name}: {reference_config}")
-                logger.debug(f"App config for {app_name}: {mcp_config}")
-                validation_results[app_name] = {
-                    'in_sync': False, 
-                    'reason': 'mismatch',
-                    'mismatched_keys': mismatched_keys,
-                    'format': handler.get_format_name()
-                }
-                all_in_sync = False
+        else:
+            # Standard validation for other formats: compare everything except the
+            # format metadata with a single dict comparison, and only walk the keys
+            # to build a diagnostic when that fails (extra app keys are allowed)
+            ref_data = {k: v for k, v in reference_config.items() if k != 'format'}
+            app_data = {k: v for k, v in mcp_config.items() if k != 'format'}
+            if ref_data == app_data:
+                mismatched_keys = []
             else:
-                validation_results[app_name] = {
-                    'in_sync': True,
-                    'format': handler.get_format_name()
-                }
-                
-        if all_in_sync:
-            logger.info("All configuration files are in sync with the reference configuration")
+                mismatched_keys = _find_mismatched_keys(reference_config, mcp_config)
+            is_in_sync = not mismatched_keys
         
-        return all_in_sync, validation_results
+        if not is_in_sync:
+            logger.warning(f"Config mismatch detected for {app_name} at {config_path}")
+            logger.warning(f"Mismatched keys: {', '.join(mismatched_keys)}")
+            logger.debug(f"Reference config for {app_name}: {reference_config}")
+            logger.debug(f"App config for {app_name}: {mcp_config}")
+            return {
+                'in_sync': False, 
+                'reason': 'mismatch',
+                'mismatched_keys': mismatched_keys,
+                'format': handler.get_format_name()
+            }
+        
+        return {
+            'in_sync': True,
+            'format': handler.get_format_name()
+        }
     
-    def print_report(self, sync_results, validation_results, source=None):
-        """Print a detailed report of the synchronization operation."""
-        # Determine overall status
-        all_success = all(result.get('success', False) for result in sync_results.values())
+    def print_report(self, sync_results, validation_results, source=None, quiet=False):
+        """Print a detailed report of the synchronization operation.
+        
+        With quiet=True nothing is printed and only the overall status is returned.
+        """
+        # Count successful configurations and determine overall status
+        total_count = len(sync_results)
+        success_count = sum(1 for result in sync_results.values() if result.get('success', False))
+        all_success = success_count == total_count
         all_in_sync = all(result.get('in_sync', False) for result in validation_results.values())
         
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
         overall_status = "SUCCESS" if all_success and all_in_sync else "PARTIAL_SUCCESS" if all_success else "FAILED"
         
-        # Count successful configurations
-        success_count = sum(1 for result in sync_results.values() if result.get('success', False))
-        total_count = len(sync_results)
+        if quiet:
+            return overall_status
+        
+        # Skip the rich rendering when nobody is looking at a terminal (pipes, CI logs)
+        if not console.is_terminal:
+            self._print_report_plain(sync_results, validation_results, source,
+                                     overall_status, timestamp, success_count)
+            return overall_status
         
         # Determine status color and icon
         if overall_status == "SUCCESS":
@@ -745,122 +1126,99 @@ class MCPConfigSynchronizer:
             status_icon = "❌"
         
         # Create header panel
-        header_text = f"""[bold white]MCP Configuration Synchronization Report[/bold white]
-[dim]{timestamp}[/dim]
-
-{status_icon} Status: [{status_color}]{overall_status}[/{status_color}]"""
-        
+        header_lines = [
+            "[bold white]MCP Configuration Synchronization Report[/bold white]",
+            f"[dim]{timestamp}[/dim]",
+            "",
+            f"{status_icon} Status: [{status_color}]{overall_status}[/{status_color}]"
+        ]
         if source:
-            header_text += f"\n📁 Source: [cyan]{source}[/cyan]"
+            header_lines.append(f"📁 Source: [cyan]{source}[/cyan]")
+        header_lines.append(f"📊 Apps Configured: [bold]{success_count}/{total_count}[/bold]")
+        header_text = "\n".join(header_lines)
         
-        header_text += f"""
-📊 Apps Configured: [bold]{success_count}/{total_count}[/bold]"""
+        # Render the whole report into a buffer so it reaches the terminal in a single write
+        buffer = io.StringIO()
+        report_console = Console(
+            file=buffer,
+            force_terminal=console.is_terminal,
+            color_system=console.color_system,
+            width=console.width
+        )
         
-        console.print()
-        console.print(Panel(header_text, title="🔄 Sync Report", border_style=status_color, padding=(1, 2)))
+        # Blank spacer lines go straight into the buffer instead of through Rich
+        buffer.write("\n")
+        report_console.print(Panel(header_text, title="🔄 Sync Report", border_style=status_color, padding=(1, 2)))
         
         # Create details table
-        table = Table(
-            title="📋 Application Details",
-            box=box.ROUNDED,
-            show_header=True,
-            header_style="bold blue"
-        )
-        table.add_column("App", style="cyan", no_wrap=True, width=15)
-        table.add_column("Status", justify="center", width=8)
-        table.add_column("Action", style="white", width=10)
-        table.add_column("Size", justify="right", width=8)
-        table.add_column("Validation", justify="center", width=12)
-        table.add_column("Details", style="dim", width=30)
+        table = _make_report_table()
         
         # Populate table with app details
+        rows = [_build_row(app_name, result, validation_results.get(app_name, {}))
+                for app_name, result in sync_results.items()]
+        for row in rows:
+            table.add_row(*row)
+        
+        report_console.print(table)
+        buffer.write("\n")
+        
+        console.file.write(buffer.getvalue())
+        console.file.flush()
+        return overall_status
+    
+    def _print_report_plain(self, sync_results, validation_results, source, overall_status, timestamp, success_count):
+        """Print the synchronization report as plain tab-separated text."""
+        lines = [
+            f"MCP Configuration Synchronization Report ({timestamp})",
+            f"Status: {overall_status}"
+        ]
+        if source:
+            lines.append(f"Source: {source}")
+        lines.append(f"Apps Configured: {success_count}/{len(sync_results)}")
+        
         for app_name, result in sync_results.items():
             success = result.get('success', False)
-            
-            # Status icon and color
-            if success:
-                status_icon = "✅"
-                status_color = "green"
-            else:
-                status_icon = "❌"
-                status_color = "red"
-            
-            # Action and size
-            action = result.get('action', 'failed') if success else result.get('action', 'failed')
-            size_str = f"{result.get('size', 0)} B" if success and 'size' in result else "—"
-            
-            # Details column (initialize first)
-            details = ""
-            if success and 'path' in result:
-                path_parts = str(result['path']).split('/')
-                if len(path_parts) > 3:
-                    details = f".../{'/'.join(path_parts[-2:])}"
-                else:
-                    details = str(result['path'])
-            elif not success:
-                if action == 'cancelled':
-                    details = result.get('reason', 'user cancelled')
-                else:
-                    details = result.get('error', 'Unknown error')[:30] + "..." if len(result.get('error', '')) > 30 else result.get('error', 'Unknown error')
-            
-            # Validation status
             validation = validation_results.get(app_name, {})
             if validation and success:
-                in_sync = validation.get('in_sync', False)
-                if in_sync:
-                    validation_display = "[green]✓ in sync[/green]"
-                else:
-                    reason = validation.get('reason', 'unknown')
-                    mismatched_keys = validation.get('mismatched_keys', [])
-                    if mismatched_keys:
-                        validation_display = f"[red]✗ {reason}[/red]"
-                        # Show first mismatched key in details if there are mismatches
-                        details = f"Mismatch: {mismatched_keys[0]}"
-                    else:
-                        validation_display = f"[red]✗ {reason}[/red]"
+                validation_status = 'in_sync' if validation.get('in_sync', False) else validation.get('reason', 'unknown')
             else:
-                validation_display = "—"
+                validation_status = '-'
             
-            table.add_row(
-                f"📱 {app_name}",
-                f"[{status_color}]{status_icon}[/{status_color}]",
-                action,
-                size_str,
-                validation_display,
-                details
-            )
+            if success:
+                details = str(result.get('path', ''))
+            elif result.get('action') == 'cancelled':
+                details = result.get('reason', 'user cancelled')
+            else:
+                details = result.get('error') or 'Unknown error'
+            if success and validation.get('mismatched_keys'):
+                details = f"Mismatch: {validation['mismatched_keys'][0]}"
+            
+            lines.append(f"{app_name}\t{result.get('action', 'failed')}\t{validation_status}\t{details}")
         
-        console.print(table)
-        console.print()
-        return overall_status
+        console.file.write("\n".join(lines) + "\n")
+        console.file.flush()
     
-    def sync_from_file(self, app_name_or_path, force=False):
-        """Synchronize MCP configuration from a specified source file."""
-        # Determine source file path
-        source_path = None
-        source_name = None
+    def sync_from_file(self, app_name_or_path, force=False, quiet=False):
+        """Synchronize MCP configuration from a specified source file.
         
-        if app_name_or_path in self.CONFIG_FILES:
-            source_name = app_name_or_path
-            source_path = self.CONFIG_FILES[app_name_or_path]
-        else:
+        With quiet=True the report is skipped; the return value still reflects the outcome.
+        """
+        # Determine source file path
+        source_name = app_name_or_path
+        source_path = self.CONFIG_FILES.get(app_name_or_path)
+        if source_path is None:
             # Treat as direct file path
             source_path = Path(app_name_or_path)
-            source_name = str(source_path)
-        
-        if not source_path.exists():
-            logger.error(f"Source file does not exist: {source_path}")
-            return False
         
         # Load configuration from source
-        source_config = self.load_existing_config(source_path)
+        source_config, handler, mcp_config = self.load_mcp_config(source_path)
         if source_config is None:
             logger.error(f"Failed to parse source configuration at {source_path}")
             return False
         
-        # Detect format and extract MCP configuration using appropriate handler
-        handler = self.detect_config_format(source_config)
-        mcp_config = handler.extract_mcp_config(source_config)
+        if handler is None:
+            logger.error(f"Source file does not exist: {source_path}")
+            return False
         
         if not mcp_config:
             logger.error(f"No MCP configuration found in {source_path}")
@@ -878,7 +1236,7 @@ class MCPConfigSynchronizer:
         all_in_sync, validation_results = self.validate_configs()
         
         # Generate report
-        status = self.print_report(sync_results, validation_results, source=source_name)
+        status = self.print_report(sync_results, validation_results, source=source_name, quiet=quiet)
         
         if status == "SUCCESS":
             logger.info(f"MCP configuration synchronization from source completed successfully")
@@ -749,8 +749,7 @@ class MCPManagerApp(App):
         
         # Save to file
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, 'w') as f:
-            json.dump(updated_config, f, indent=2)
+        self.synchronizer.write_config(config_path, updated_config)
         
         # Update cached config
         self.app_configs[self.current_app] = updated_config